@@ -1,9 +1,18 @@
+import csv
+import hashlib
+import io
 import json
 import os
+import re
+import secrets
 import uuid
+import zipfile
 from datetime import date, datetime, timedelta
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import streamlit as st
 from fpdf import FPDF
 from fpdf.errors import FPDFException
@@ -54,6 +63,33 @@ UPDATE_COLUMNS = [
     "pdf_path",
 ]
 
+# Reporting cadences offered at onboarding, with the days between updates.
+CADENCE_DAYS = {"Weekly": 7, "Biweekly": 14, "Monthly": 30, "Quarterly": 90}
+
+# Companies due within this many days are flagged as "Due Soon".
+UPCOMING_WINDOW_DAYS = 7
+
+# Rows per page in the dashboard updates table.
+TABLE_PAGE_SIZE = 200
+
+# Update detail expanders rendered per page on the dashboard.
+DETAILS_PAGE_SIZE = 20
+
+# Update fields shown in the dashboard history table, with their column headers.
+HISTORY_TABLE_COLUMNS = {
+    "submission_date": "Date",
+    "company_name": "Company",
+    "reporting_period": "Period",
+    "revenue": "Revenue",
+    "expenses": "Expenses",
+    "cash": "Cash",
+    "runway_months": "Runway (mo)",
+    "submitted_by": "Submitted By",
+}
+
+# Update fields covered by the dashboard text search.
+SEARCH_COLUMNS = ["company_name", "narrative", "wins", "challenges"]
+
 # ---------------------------------------------------------------------------
 # Custom CSS for professional styling
 # ---------------------------------------------------------------------------
@@ -316,19 +352,64 @@ hr {
 # ---------------------------------------------------------------------------
 
 
+# Report sections, in order: (PDF heading, update field).
+_PDF_FIELDS = (
+    ("Company", "company_name"),
+    ("Reporting Period", "reporting_period"),
+    ("Submitted", "submission_date"),
+    ("Submitted By", "submitted_by"),
+    ("Revenue", "revenue"),
+    ("Expenses", "expenses"),
+    ("Cash", "cash"),
+    ("Runway (months)", "runway_months"),
+    ("Wins", "wins"),
+    ("Challenges", "challenges"),
+    ("Asks", "asks"),
+    ("Investment Update", "investment_update"),
+    ("Narrative", "narrative"),
+    ("Meeting Agenda", "meeting_agenda"),
+    ("Meeting Minutes", "meeting_minutes"),
+    ("Data Warehouse Link", "data_warehouse_link"),
+)
+
+# Single-character clean-up for PDF text: lone CR becomes a newline, tabs and
+# non-breaking spaces become spaces, and other control characters (which FPDF
+# cannot render) are dropped.
+_PDF_TEXT_TABLE = dict.fromkeys(code for code in range(32) if code != ord("\n"))
+_PDF_TEXT_TABLE.update({ord("\r"): "\n", ord("\t"): " ", ord("\u00a0"): " "})
+
+
 def _normalize_pdf_text(value: str | None) -> str:
     text = str(value) if value is not None else "-"
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = text.replace("\t", " ").replace("\u00a0", " ")
-    text = "".join(ch for ch in text if ch == "\n" or ord(ch) >= 32)
+    text = text.replace("\r\n", "\n").translate(_PDF_TEXT_TABLE)
     return text or "-"
 
 
+class _SlugTable(dict):
+    """str.translate table keeping alphanumerics, "-" and "_"; filled lazily per code point."""
+
+    def __missing__(self, code: int) -> str:
+        ch = chr(code)
+        self[code] = mapped = ch if ch.isalnum() or ch in "-_" else "_"
+        return mapped
+
+
+@st.cache_resource(show_spinner=False)
+def _slug_table() -> dict[int, str]:
+    """One slug table per process; a module-level table would start empty on every rerun."""
+    return _SlugTable()
+
+
 def _safe_pdf_slug(raw: str) -> str:
-    return "".join(ch if ch.isalnum() or ch in {"-", "_"} else "_" for ch in raw).strip("_") or "company"
+    return raw.translate(_slug_table()).strip("_") or "company"
 
 
 class UpdatePDF(FPDF):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # One timestamp per document, shared by every page footer.
+        self.generated_on = datetime.now().strftime("%Y-%m-%d")
+
     def header(self):
         self.set_font("helvetica", "B", 16)
         self.set_text_color(15, 23, 42)
@@ -339,26 +420,25 @@ class UpdatePDF(FPDF):
         self.ln(8)
 
     def add_section(self, title: str, value: str):
-        safe_title = _normalize_pdf_text(title)
-        safe_value = _normalize_pdf_text(value)
+        """Render a titled block; both strings must already be _normalize_pdf_text output."""
         usable_width = max(self.w - self.l_margin - self.r_margin, 10)
 
         self.set_x(self.l_margin)
         self.set_font("helvetica", "B", 11)
         self.set_text_color(30, 41, 59)
-        self.multi_cell(usable_width, 7, safe_title)
+        self.multi_cell(usable_width, 7, title)
 
         self.set_x(self.l_margin)
         self.set_font("helvetica", "", 10)
         self.set_text_color(71, 85, 105)
-        self.multi_cell(usable_width, 6, safe_value, wrapmode="CHAR")
+        self.multi_cell(usable_width, 6, value, wrapmode="CHAR")
         self.ln(3)
 
     def footer(self):
         self.set_y(-15)
         self.set_font("helvetica", "I", 8)
         self.set_text_color(148, 163, 184)
-        self.cell(0, 10, f"Page {self.page_no()}  |  Generated {datetime.now().strftime('%Y-%m-%d')}", align="C")
+        self.cell(0, 10, f"Page {self.page_no()}  |  Generated {self.generated_on}", align="C")
 
 
 # ---------------------------------------------------------------------------
@@ -366,7 +446,9 @@ class UpdatePDF(FPDF):
 # ---------------------------------------------------------------------------
 
 
+@st.cache_resource(show_spinner=False)
 def ensure_storage() -> None:
+    """Create the data directories and empty stores; runs once per server process."""
     os.makedirs(DATA_DIR, exist_ok=True)
     os.makedirs(PDF_DIR, exist_ok=True)
     if not os.path.exists(COMPANIES_PATH):
@@ -389,50 +471,207 @@ def _json_safe(value):
     return value
 
 
+def _data_version(path: str) -> tuple[int, int]:
+    """Cheap cache key for a data file: changes whenever the file is rewritten or appended to."""
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
 def _read_json_list(path: str) -> list[dict]:
-    ensure_storage()
     with open(path, "r", encoding="utf-8") as f:
         data = json.load(f)
     return data if isinstance(data, list) else []
 
 
 def _write_json_list(path: str, rows: list[dict]) -> None:
+    # Encode in one call and write once; json.dump would issue a write per token.
+    text = json.dumps(rows, indent=2)
     with open(path, "w", encoding="utf-8") as f:
-        json.dump(rows, f, indent=2)
-
-
-@st.cache_data
-def load_companies() -> pd.DataFrame:
+        f.write(text)
+
+
+def _append_json_row(path: str, row: dict) -> None:
+    """Append one record to a JSON list file without re-reading the whole list."""
+    # Same layout json.dump(..., indent=2) produces for a list element.
+    entry = json.dumps([row], indent=2)[1:-1].encode("utf-8")
+    with open(path, "r+b") as f:
+        size = f.seek(0, os.SEEK_END)
+        tail_start = max(size - 4096, 0)
+        f.seek(tail_start)
+        tail = f.read()
+        close_at = tail.rfind(b"]")
+        if close_at != -1:
+            body = tail[:close_at].rstrip()
+            f.seek(tail_start + len(body))
+            f.write((entry if body.endswith(b"[") else b"," + entry) + b"]")
+            f.truncate()
+            return
+    # No closing bracket to patch; let the regular read/write path handle the file.
+    rows = _read_json_list(path)
+    rows.append(row)
+    _write_json_list(path, rows)
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_companies(version: tuple[int, int]) -> pd.DataFrame:
     rows = _read_json_list(COMPANIES_PATH)
     normalized = [{col: row.get(col, "") for col in COMPANY_COLUMNS} for row in rows]
     df = pd.DataFrame(normalized, columns=COMPANY_COLUMNS)
     if "next_due_date" in df.columns:
-        df["next_due_date"] = pd.to_datetime(df["next_due_date"], errors="coerce")
+        # Due dates are always ISO strings ("YYYY-MM-DD", or with a time part from older
+        # saves); naming the format keeps pandas on its fast ISO parser.
+        df["next_due_date"] = pd.to_datetime(df["next_due_date"], format="ISO8601", errors="coerce")
     if "is_active" in df.columns:
         df["is_active"] = df["is_active"].fillna(True)
-    return df
+    # Few distinct values repeated across companies: keep one copy each and compare on codes.
+    return df.astype(dict.fromkeys(("reporting_cadence", "fund", "portfolio_manager"), "category"))
+
+
+_UPDATE_TEXT_COLUMNS = [col for col in UPDATE_COLUMNS if col not in ("company_name", "runway_months")]
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _load_updates(version: tuple[int, int]) -> pd.DataFrame:
+    # Let pandas pick the known columns straight from the records; fields missing
+    # from older rows come back as NaN and are blanked in one vectorized pass.
+    df = pd.DataFrame(_read_json_list(UPDATES_PATH), columns=UPDATE_COLUMNS).fillna("")
+    # Keep submission dates as ISO "YYYY-MM-DD" strings: they sort correctly as text and
+    # are displayed as-is. The slice drops the time part older saves may have written.
+    df["submission_date"] = df["submission_date"].astype(str).str[:10]
+    # Many updates per company: store the name once per company and compare on codes.
+    df["company_name"] = df["company_name"].astype("category")
+    # Runway is stored as an int; keep it numeric (blank -> <NA>) instead of mixed objects.
+    # Round first: Int32 rejects fractional values such as a hand-edited 6.5.
+    df["runway_months"] = pd.to_numeric(df["runway_months"], errors="coerce").round().astype("Int32")
+    # Free text lives in contiguous Arrow buffers instead of one Python object per cell.
+    return df.astype(dict.fromkeys(_UPDATE_TEXT_COLUMNS, "string[pyarrow]"))
+
+
+# The loaders are keyed on the file's (mtime, size): any write, including edits made
+# outside the app, is picked up on the next run without clearing caches by hand.
+def load_companies() -> pd.DataFrame:
+    """All companies as a DataFrame shared by reference across reruns; treat it as read-only."""
+    return _load_companies(_data_version(COMPANIES_PATH))
 
 
-@st.cache_data
 def load_updates() -> pd.DataFrame:
-    rows = _read_json_list(UPDATES_PATH)
-    normalized = [{col: row.get(col, "") for col in UPDATE_COLUMNS} for row in rows]
-    df = pd.DataFrame(normalized, columns=UPDATE_COLUMNS)
-    if "submission_date" in df.columns:
-        df["submission_date"] = pd.to_datetime(df["submission_date"], errors="coerce")
-    return df
+    """All updates as a DataFrame shared by reference across reruns; treat it as read-only."""
+    return _load_updates(_data_version(UPDATES_PATH))
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _company_names(version: tuple[int, int]) -> list[str]:
+    """Sorted, de-duplicated company names for pickers."""
+    return sorted(_load_companies(version)["company_name"].unique().tolist())
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _companies_by_due_date(version: tuple[int, int]) -> pd.DataFrame:
+    """Companies ordered by next due date (undated last), shared read-only across reruns."""
+    return _load_companies(version).sort_values("next_due_date", kind="stable", na_position="last")
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _company_ids(version: tuple[int, int]) -> dict[str, str]:
+    """Company name -> company_id lookup for the update form."""
+    companies = _load_companies(version)
+    return dict(zip(companies["company_name"], companies["company_id"]))
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _updates_csv_bytes(version: tuple[int, int]) -> bytes:
+    """CSV export of all updates, rebuilt only when the updates file changes."""
+    # Written straight from the stored records, like the JSON export, without a DataFrame pass.
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=UPDATE_COLUMNS, restval="", extrasaction="ignore", lineterminator="\n")
+    writer.writeheader()
+    writer.writerows(_read_json_list(UPDATES_PATH))
+    return buf.getvalue().encode("utf-8")
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _updates_json_bytes(version: tuple[int, int]) -> bytes:
+    """JSON export of all updates: the store is already an indented JSON list, so serve it as-is."""
+    with open(UPDATES_PATH, "rb") as f:
+        return f.read()
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _pdf_count(version: tuple[int, int]) -> int:
+    """Number of generated PDFs; keyed on the directory version, which changes when files come or go."""
+    with os.scandir(PDF_DIR) as entries:
+        return sum(1 for entry in entries if entry.name.endswith(".pdf") and entry.is_file())
+
+
+@st.cache_data(show_spinner=False, max_entries=1)
+def _pdf_archive(version: tuple[int, int]) -> tuple[bytes, int]:
+    """Every generated update PDF in one zip, and how many updates have none yet."""
+    buf = io.BytesIO()
+    missing = 0
+    written = set()
+    # PDF content streams are already compressed; storing skips a pointless deflate pass.
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_STORED) as zf:
+        for path in _load_updates(version)["pdf_path"]:
+            # Reports are generated on demand; ones nobody has generated are counted, not rendered.
+            if not (path and os.path.exists(path)):
+                missing += 1
+            elif path not in written:
+                zf.write(path, arcname=os.path.basename(path))
+                written.add(path)
+    return buf.getvalue(), missing
+
+
+@st.cache_data(show_spinner=False, max_entries=256)
+def _pdf_bytes(path: str, version: tuple[int, int]) -> bytes:
+    """Contents of an exported PDF, re-read only if the file changes."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _search_index(version: tuple[int, int]) -> pa.Array:
+    """Lowercased search text for each update row of that file version, as an Arrow array."""
+    updates = _load_updates(version)
+    # The separator keeps a query from matching across two fields.
+    haystack = updates[SEARCH_COLUMNS[0]].astype(str)
+    for col in SEARCH_COLUMNS[1:]:
+        haystack = haystack + "\x1f" + updates[col].astype(str)
+    return pa.array(haystack.str.lower(), type=pa.string())
+
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def _company_rows(version: tuple[int, int]) -> dict[str, np.ndarray]:
+    """Row positions of each company's updates in that file version."""
+    return _load_updates(version).groupby("company_name", observed=True).indices
+
+
+def _matching_rows(query: str, version: tuple[int, int]) -> np.ndarray:
+    """Positions of updates whose search text contains every whitespace-separated query term."""
+    haystack = _search_index(version)
+    terms = query.split()
+    # One vectorized Arrow kernel call per term over the whole column; the text is
+    # already lowercased, so the case-sensitive kernel is enough.
+    mask = pc.match_substring(haystack, terms[0])
+    for term in terms[1:]:
+        mask = pc.and_(mask, pc.match_substring(haystack, term))
+    return np.flatnonzero(mask.to_numpy(zero_copy_only=False))
+
+
+def _records_for_save(df: pd.DataFrame, columns: list[str], date_columns: tuple[str, ...] = ()) -> list[dict]:
+    """JSON-ready rows: dates as "YYYY-MM-DD" and missing values as "", prepared column-wise."""
+    out = df.reindex(columns=columns)
+    for col in date_columns:
+        out[col] = pd.to_datetime(out[col], format="ISO8601", errors="coerce").dt.strftime("%Y-%m-%d")
+    out = out.astype(object)
+    return out.where(out.notna(), "").to_dict(orient="records")
 
 
 def save_companies(df: pd.DataFrame) -> None:
-    payload = [{col: _json_safe(row.get(col, "")) for col in COMPANY_COLUMNS} for row in df.to_dict(orient="records")]
-    _write_json_list(COMPANIES_PATH, payload)
-    st.cache_data.clear()
+    _write_json_list(COMPANIES_PATH, _records_for_save(df, COMPANY_COLUMNS, date_columns=("next_due_date",)))
 
 
 def save_updates(df: pd.DataFrame) -> None:
-    payload = [{col: _json_safe(row.get(col, "")) for col in UPDATE_COLUMNS} for row in df.to_dict(orient="records")]
-    _write_json_list(UPDATES_PATH, payload)
-    st.cache_data.clear()
+    _write_json_list(UPDATES_PATH, _records_for_save(df, UPDATE_COLUMNS))
 
 
 # ---------------------------------------------------------------------------
@@ -440,29 +679,24 @@ def save_updates(df: pd.DataFrame) -> None:
 # ---------------------------------------------------------------------------
 
 
+_CADENCE_DELTAS = {cadence: timedelta(days=days) for cadence, days in CADENCE_DAYS.items()}
+_DEFAULT_CADENCE_DELTA = _CADENCE_DELTAS["Monthly"]
+
+
 def cadence_to_delta(cadence: str) -> timedelta:
-    return {
-        "Weekly": timedelta(days=7),
-        "Biweekly": timedelta(days=14),
-        "Monthly": timedelta(days=30),
-        "Quarterly": timedelta(days=90),
-    }.get(cadence, timedelta(days=30))
+    return _CADENCE_DELTAS.get(cadence, _DEFAULT_CADENCE_DELTA)
 
 
-def next_due_from_today(cadence: str) -> date:
-    return date.today() + cadence_to_delta(cadence)
+def next_due_from_today(cadence: str, today: date) -> date:
+    return today + cadence_to_delta(cadence)
 
 
 def add_company(row: dict) -> None:
-    companies = load_companies()
-    out = pd.concat([companies, pd.DataFrame([row], columns=COMPANY_COLUMNS)], ignore_index=True)
-    save_companies(out)
+    _append_json_row(COMPANIES_PATH, {col: _json_safe(row.get(col, "")) for col in COMPANY_COLUMNS})
 
 
 def add_update(row: dict) -> None:
-    updates = load_updates()
-    out = pd.concat([updates, pd.DataFrame([row], columns=UPDATE_COLUMNS)], ignore_index=True)
-    save_updates(out)
+    _append_json_row(UPDATES_PATH, {col: _json_safe(row.get(col, "")) for col in UPDATE_COLUMNS})
 
 
 def delete_company(company_id: str) -> None:
@@ -481,50 +715,66 @@ def delete_update(update_id: str) -> None:
     updates = load_updates()
     # Clean up associated PDF file
     match = updates[updates["update_id"] == update_id]
+    updates = updates[updates["update_id"] != update_id]
     if not match.empty:
         pdf_path = match.iloc[0].get("pdf_path", "")
-        if pdf_path and os.path.exists(pdf_path):
+        # Keep the file if another update still points at it.
+        if pdf_path and os.path.exists(pdf_path) and not (updates["pdf_path"] == pdf_path).any():
             os.remove(pdf_path)
-    updates = updates[updates["update_id"] != update_id]
     save_updates(updates)
 
 
-def generate_pdf(update_data: dict) -> str:
+def set_company_due_date(company_id: str, today: date) -> None:
+    """Move one company's next due date a full reporting cycle past today."""
+    rows = _read_json_list(COMPANIES_PATH)
+    for row in rows:
+        if row.get("company_id") == company_id:
+            row["next_due_date"] = str(next_due_from_today(row.get("reporting_cadence", ""), today))
+            break
+    _write_json_list(COMPANIES_PATH, rows)
+
+
+def set_update_pdf_path(update_id: str, pdf_path: str) -> None:
+    """Record a generated PDF on one stored update."""
+    rows = _read_json_list(UPDATES_PATH)
+    for row in rows:
+        if row.get("update_id") == update_id:
+            row["pdf_path"] = pdf_path
+            break
+    _write_json_list(UPDATES_PATH, rows)
+
+
+def generate_pdf(update_data: dict) -> tuple[str, bytes]:
+    """Render the update report, save it under PDF_DIR and return (path, PDF bytes)."""
     company_slug = _safe_pdf_slug(str(update_data.get("company_name", "company")))
-    filename = f"update_{company_slug}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
-    output_path = os.path.join(PDF_DIR, filename)
+
+    order = [(title, update_data[field]) for title, field in _PDF_FIELDS]
+
+    # Name the file after its update and content: regenerating an unchanged update reuses its
+    # PDF, while two updates with identical content still get separate files.
+    key = json.dumps([update_data.get("update_id", ""), order], default=str)
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).hexdigest()
+    output_path = os.path.join(PDF_DIR, f"update_{company_slug}_{digest}.pdf")
+    if os.path.exists(output_path):
+        with open(output_path, "rb") as f:
+            return output_path, f.read()
 
     pdf = UpdatePDF()
     pdf.set_auto_page_break(auto=True, margin=15)
     pdf.add_page()
 
-    order = [
-        ("Company", update_data["company_name"]),
-        ("Reporting Period", update_data["reporting_period"]),
-        ("Submitted", update_data["submission_date"]),
-        ("Submitted By", update_data["submitted_by"]),
-        ("Revenue", update_data["revenue"]),
-        ("Expenses", update_data["expenses"]),
-        ("Cash", update_data["cash"]),
-        ("Runway (months)", update_data["runway_months"]),
-        ("Wins", update_data["wins"]),
-        ("Challenges", update_data["challenges"]),
-        ("Asks", update_data["asks"]),
-        ("Investment Update", update_data["investment_update"]),
-        ("Narrative", update_data["narrative"]),
-        ("Meeting Agenda", update_data["meeting_agenda"]),
-        ("Meeting Minutes", update_data["meeting_minutes"]),
-        ("Data Warehouse Link", update_data["data_warehouse_link"]),
-    ]
-
     for title, value in order:
+        text = _normalize_pdf_text(value)
         try:
-            pdf.add_section(title, str(value))
+            pdf.add_section(title, text)
         except FPDFException:
-            pdf.add_section(title, _normalize_pdf_text(value).encode("ascii", "replace").decode("ascii"))
+            pdf.add_section(title, text.encode("ascii", "replace").decode("ascii"))
 
-    pdf.output(output_path)
-    return output_path
+    # Render once and keep the bytes, so callers can offer the download without re-reading the file.
+    data = bytes(pdf.output())
+    with open(output_path, "wb") as f:
+        f.write(data)
+    return output_path, data
 
 
 def reminder_text(company_name: str, cadence: str, due_date: str) -> str:
@@ -540,15 +790,14 @@ def reminder_text(company_name: str, cadence: str, due_date: str) -> str:
     )
 
 
-def _due_status(due_date, today) -> str:
-    if due_date is None:
-        return "unknown"
-    diff = (due_date - today).days
-    if diff < 0:
-        return "overdue"
-    elif diff <= 7:
-        return "upcoming"
-    return "on-track"
+def _due_statuses(due_dates: pd.Series, today: date) -> np.ndarray:
+    """Status per due date: overdue, upcoming within UPCOMING_WINDOW_DAYS, else on-track; NaT is "unknown"."""
+    days = (due_dates - pd.Timestamp(today)).dt.days
+    return np.select(
+        [days.isna(), days < 0, days <= UPCOMING_WINDOW_DAYS],
+        ["unknown", "overdue", "upcoming"],
+        default="on-track",
+    )
 
 
 def _status_html(status: str) -> str:
@@ -556,6 +805,256 @@ def _status_html(status: str) -> str:
     return f'<span class="status-badge status-{status}">{labels.get(status, status)}</span>'
 
 
+# Badge markup per status, built once instead of per rendered company.
+_STATUS_BADGES = {status: _status_html(status) for status in ("overdue", "upcoming", "on-track", "unknown")}
+
+
+@st.cache_resource
+def _minified_css() -> str:
+    """CUSTOM_CSS without comments and redundant whitespace; it is re-sent on every rerun."""
+    css = re.sub(r"/\*.*?\*/", "", CUSTOM_CSS, flags=re.DOTALL)
+    css = re.sub(r"\s+", " ", css)
+    return re.sub(r"\s*([{};,>])\s*", r"\1", css).strip()
+
+
+@st.fragment
+def _company_delete_controls(company_id: str, company_name: str) -> None:
+    """Delete button with inline confirmation; toggling the prompt only reruns this fragment."""
+    confirm_key = f"confirm_del_company_{company_id}"
+    if st.session_state.get(confirm_key):
+        st.warning(f"Are you sure you want to delete **{company_name}** and all its updates?")
+        yes_col, no_col, _ = st.columns([1, 1, 4])
+        if yes_col.button("Yes, delete", key=f"yes_del_{company_id}", type="primary"):
+            delete_company(company_id)
+            st.session_state.pop(confirm_key, None)
+            # The data changed, so the whole page needs to redraw.
+            st.rerun()
+        if no_col.button("Cancel", key=f"no_del_{company_id}"):
+            st.session_state.pop(confirm_key, None)
+            st.rerun(scope="fragment")
+    else:
+        if st.button("Delete company", key=f"del_{company_id}"):
+            st.session_state[confirm_key] = True
+            st.rerun(scope="fragment")
+
+
+def _set_details_page(page: int) -> None:
+    st.session_state["details_page"] = page
+
+
+@st.fragment
+def _update_history(companies_df: pd.DataFrame) -> None:
+    """Search, table and details; typing in the search box only reruns this fragment."""
+    # A fragment rerun keeps the arguments of the last full run, so take a fresh snapshot
+    # here: the frame and the cached row positions below must come from the same version.
+    version = _data_version(UPDATES_PATH)
+    updates_df = _load_updates(version)
+    # Search and filter controls
+    filter_col1, filter_col2 = st.columns([3, 1])
+    with filter_col1:
+        search = st.text_input(
+            "Search updates",
+            placeholder="Search by company, narrative, wins, or challenges...",
+            label_visibility="collapsed",
+            # A new query starts its details from the first page.
+            on_change=_set_details_page,
+            args=(0,),
+        )
+    with filter_col2:
+        if not companies_df.empty:
+            company_filter = st.selectbox(
+                "Filter by company",
+                ["All Companies"] + _company_names(_data_version(COMPANIES_PATH)),
+                label_visibility="collapsed",
+                on_change=_set_details_page,
+                args=(0,),
+            )
+        else:
+            company_filter = "All Companies"
+
+    query = search.lower().strip()
+    if len(query) < 2:
+        # A single character matches nearly everything; wait for a real query.
+        query = ""
+    if not query and company_filter == "All Companies":
+        # Nothing to filter (the usual first view): skip the mask entirely.
+        filtered = updates_df
+    else:
+        # Combine both filters into one row mask and index the frame once.
+        mask = np.ones(len(updates_df), dtype=bool)
+
+        # Apply text search
+        if query:
+            hits = np.zeros(len(updates_df), dtype=bool)
+            hits[_matching_rows(query, version)] = True
+            mask &= hits
+
+        # Apply company filter
+        if company_filter != "All Companies":
+            company_hits = np.zeros(len(updates_df), dtype=bool)
+            company_hits[_company_rows(version).get(company_filter, [])] = True
+            mask &= company_hits
+
+        filtered = updates_df[mask]
+
+    # add_update appends in submission order, so newest-first is normally just
+    # the reversed frame; only fall back to a sort if the file was reordered.
+    if updates_df["submission_date"].is_monotonic_increasing:
+        filtered = filtered.iloc[::-1]
+    else:
+        filtered = filtered.sort_values("submission_date", ascending=False)
+
+    # Only ship one page of rows to the browser; large histories otherwise
+    # dominate rerun latency even when filtering is fast.
+    page_count = max(1, -(-len(filtered) // TABLE_PAGE_SIZE))
+    info_col, page_col = st.columns([3, 1])
+    with page_col:
+        # The table pages TABLE_PAGE_SIZE rows at a time; Update Details below has its own,
+        # smaller pager because expanders cost far more to render than table rows.
+        page = st.number_input(
+            "Table page",
+            min_value=1,
+            max_value=page_count,
+            value=1,
+            disabled=page_count == 1,
+            label_visibility="collapsed",
+        )
+    page_start = (int(page) - 1) * TABLE_PAGE_SIZE
+    with info_col:
+        st.markdown(
+            f"Showing **{len(filtered)}** of **{len(updates_df)}** updates"
+            + (f"  |  Table page {int(page)} of {page_count}" if page_count > 1 else "")
+        )
+    st.markdown("")
+
+    # Display table: slice the page and select the shown columns; no copy is needed.
+    st.dataframe(
+        filtered.iloc[page_start : page_start + TABLE_PAGE_SIZE][list(HISTORY_TABLE_COLUMNS)].rename(
+            columns=HISTORY_TABLE_COLUMNS
+        ),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+    # Detail view for each update
+    if not filtered.empty:
+        st.markdown("---")
+        st.markdown("### Update Details")
+
+        # Only build expanders for one page; the page survives reruns in session state
+        # and is clamped when a new filter leaves fewer rows.
+        details_pages = max(1, -(-len(filtered) // DETAILS_PAGE_SIZE))
+        details_page = min(st.session_state.get("details_page", 0), details_pages - 1)
+        details_start = details_page * DETAILS_PAGE_SIZE
+        page_rows = filtered.iloc[details_start : details_start + DETAILS_PAGE_SIZE]
+
+        # Plain dicts: per-field access on a Series row is much slower.
+        for row in page_rows.to_dict("records"):
+            uid = row["update_id"]
+            sub_date = row["submission_date"] or "N/A"
+            runway = "N/A" if pd.isna(row["runway_months"]) else f"{row['runway_months']} months"
+            with st.expander(f"{row['company_name']} — {row['reporting_period']} ({sub_date})"):
+                # One markdown element per block (paragraph-separated) instead of one per field.
+                d1, d2 = st.columns(2)
+                d1.markdown(
+                    f"**Revenue:** {row['revenue'] or 'N/A'}\n\n"
+                    f"**Expenses:** {row['expenses'] or 'N/A'}\n\n"
+                    f"**Cash:** {row['cash'] or 'N/A'}\n\n"
+                    f"**Runway:** {runway}"
+                )
+                meta = [f"**Submitted By:** {row['submitted_by']}", f"**Date:** {sub_date}"]
+                if row.get("data_warehouse_link"):
+                    meta.append(f"**Data Link:** {row['data_warehouse_link']}")
+                d2.markdown("\n\n".join(meta))
+
+                notes = [
+                    f"**{label}:** {row[field]}"
+                    for label, field in (
+                        ("Wins", "wins"),
+                        ("Challenges", "challenges"),
+                        ("Asks", "asks"),
+                        ("Narrative", "narrative"),
+                    )
+                    if row.get(field)
+                ]
+                if notes:
+                    st.markdown("\n\n".join(notes))
+
+                # Actions row: PDF download + delete
+                act1, act2, _ = st.columns([1, 1, 2])
+                with act1:
+                    # Only hand PDF bytes to the frontend once the user asks for them;
+                    # otherwise every rerun re-registers every listed PDF.
+                    ready_key = f"pdf_ready_{uid}"
+                    if row.get("pdf_path") and os.path.exists(row["pdf_path"]):
+                        if st.session_state.get(ready_key) or st.button(
+                            "Prepare PDF", key=f"prep_pdf_{uid}", use_container_width=True
+                        ):
+                            st.session_state[ready_key] = True
+                            st.download_button(
+                                "Download PDF",
+                                data=_pdf_bytes(row["pdf_path"], _data_version(row["pdf_path"])),
+                                file_name=os.path.basename(row["pdf_path"]),
+                                mime="application/pdf",
+                                key=f"pdf_{uid}",
+                                use_container_width=True,
+                            )
+                    elif st.button("Generate PDF", key=f"gen_pdf_{uid}", use_container_width=True):
+                        runway_value = "" if pd.isna(row["runway_months"]) else row["runway_months"]
+                        pdf_path, pdf_data = generate_pdf(dict(row, runway_months=runway_value))
+                        set_update_pdf_path(uid, pdf_path)
+                        st.session_state[ready_key] = True
+                        # Offer the bytes just rendered; later runs serve the stored file instead.
+                        st.download_button(
+                            "Download PDF",
+                            data=pdf_data,
+                            file_name=os.path.basename(pdf_path),
+                            mime="application/pdf",
+                            key=f"pdf_{uid}",
+                            use_container_width=True,
+                        )
+                with act2:
+                    confirm_key = f"confirm_del_update_{uid}"
+                    if st.session_state.get(confirm_key):
+                        st.warning("Delete this update?")
+                        y_col, n_col = st.columns(2)
+                        if y_col.button("Yes", key=f"yes_del_u_{uid}", type="primary"):
+                            delete_update(uid)
+                            st.session_state.pop(confirm_key, None)
+                            # The data changed, so the whole page needs to redraw.
+                            st.rerun()
+                        if n_col.button("No", key=f"no_del_u_{uid}"):
+                            st.session_state.pop(confirm_key, None)
+                            st.rerun(scope="fragment")
+                    else:
+                        if st.button("Delete update", key=f"del_u_{uid}", use_container_width=True):
+                            st.session_state[confirm_key] = True
+                            st.rerun(scope="fragment")
+
+        if details_pages > 1:
+            prev_col, info_col, next_col = st.columns([1, 2, 1])
+            prev_col.button(
+                "Previous",
+                key="details_prev",
+                disabled=details_page == 0,
+                on_click=_set_details_page,
+                args=(details_page - 1,),
+                use_container_width=True,
+            )
+            info_col.markdown(
+                f"Details page {details_page + 1} of {details_pages}  |  "
+                f"updates {details_start + 1}–{details_start + len(page_rows)} of {len(filtered)}"
+            )
+            next_col.button(
+                "Next",
+                key="details_next",
+                disabled=details_page >= details_pages - 1,
+                on_click=_set_details_page,
+                args=(details_page + 1,),
+                use_container_width=True,
+            )
+
+
 # ---------------------------------------------------------------------------
 # Page config & global styles
 # ---------------------------------------------------------------------------
@@ -566,11 +1065,14 @@ st.set_page_config(
     layout="wide",
     initial_sidebar_state="expanded",
 )
-st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+# st.html sends a style-only block as a bare event element: no markdown parsing and no layout slot.
+st.html(_minified_css())
 
 ensure_storage()
 companies_df = load_companies()
 updates_df = load_updates()
+# One date for the whole run, so every tab (and a submit near midnight) agrees.
+today = date.today()
 
 # ---------------------------------------------------------------------------
 # Sidebar
@@ -585,7 +1087,7 @@ with st.sidebar:
     total_companies = len(companies_df)
     total_updates = len(updates_df)
     overdue_count = (
-        int((companies_df["next_due_date"].dt.date <= date.today()).sum())
+        int((companies_df["next_due_date"] <= pd.Timestamp(today)).sum())
         if not companies_df.empty and "next_due_date" in companies_df.columns
         else 0
     )
@@ -607,13 +1109,13 @@ with st.sidebar:
 st.markdown(f"## {APP_TITLE}")
 st.caption(APP_SUBTITLE)
 
-pdf_count = len([f for f in os.listdir(PDF_DIR) if f.endswith(".pdf")])
+pdf_count = _pdf_count(_data_version(PDF_DIR))
 
 m1, m2, m3, m4 = st.columns(4)
 m1.metric("Portfolio Companies", total_companies)
 m2.metric("Total Updates", total_updates)
 m3.metric("Updates Overdue", overdue_count, delta=f"-{overdue_count}" if overdue_count else None, delta_color="inverse")
-m4.metric("PDFs Exported", pdf_count)
+m4.metric("PDFs Generated", pdf_count, help="Update reports generated so far; others are made on demand.")
 
 st.markdown("")  # spacer
 
@@ -642,8 +1144,8 @@ with onboard_tab:
             fund = st.text_input("Investment Fund", placeholder="e.g. Fund III")
             cadence = st.selectbox(
                 "Reporting Cadence",
-                ["Weekly", "Biweekly", "Monthly", "Quarterly"],
-                index=2,
+                list(CADENCE_DAYS),
+                index=list(CADENCE_DAYS).index("Monthly"),
                 help="How often this company should submit updates.",
             )
 
@@ -654,7 +1156,8 @@ with onboard_tab:
         if not company_name.strip() or not contact_name.strip() or not contact_email.strip():
             st.error("Company name, contact name, and contact email are required.")
         else:
-            token = uuid.uuid4().hex[:12]
+            # 12 random bytes as URL-safe base64: 16 characters, twice the entropy of 12 hex digits.
+            token = secrets.token_urlsafe(12)
             row = {
                 "company_id": uuid.uuid4().hex,
                 "company_name": company_name.strip(),
@@ -663,7 +1166,7 @@ with onboard_tab:
                 "portfolio_manager": portfolio_manager.strip(),
                 "fund": fund.strip(),
                 "reporting_cadence": cadence,
-                "next_due_date": str(next_due_from_today(cadence)),
+                "next_due_date": str(next_due_from_today(cadence, today)),
                 "access_token": token,
                 "is_active": True,
             }
@@ -677,36 +1180,21 @@ with onboard_tab:
         st.markdown("")
         st.subheader("Portfolio Companies")
 
-        for _, comp_row in companies_df.iterrows():
-            due_str = comp_row["next_due_date"].strftime("%Y-%m-%d") if pd.notna(comp_row["next_due_date"]) else "N/A"
-            active_label = "Active" if comp_row["is_active"] else "Inactive"
-            cid = comp_row["company_id"]
+        due_strs = companies_df["next_due_date"].dt.strftime("%Y-%m-%d").fillna("N/A")
+        for comp_row, due_str in zip(companies_df.itertuples(index=False), due_strs):
+            active_label = "Active" if comp_row.is_active else "Inactive"
 
-            with st.expander(f"{comp_row['company_name']}  —  {comp_row['reporting_cadence']}  |  Next due: {due_str}"):
+            with st.expander(f"{comp_row.company_name}  —  {comp_row.reporting_cadence}  |  Next due: {due_str}"):
                 ic1, ic2 = st.columns(2)
                 with ic1:
-                    st.markdown(f"**Contact:** {comp_row['contact_name']} ({comp_row['contact_email']})")
-                    st.markdown(f"**Portfolio Manager:** {comp_row['portfolio_manager']}")
+                    st.markdown(f"**Contact:** {comp_row.contact_name} ({comp_row.contact_email})")
+                    st.markdown(f"**Portfolio Manager:** {comp_row.portfolio_manager}")
                 with ic2:
-                    st.markdown(f"**Fund:** {comp_row['fund']}")
-                    st.markdown(f"**Status:** {active_label}  |  **Token:** `{comp_row['access_token']}`")
+                    st.markdown(f"**Fund:** {comp_row.fund}")
+                    st.markdown(f"**Status:** {active_label}  |  **Token:** `{comp_row.access_token}`")
 
                 # Delete with confirmation
-                confirm_key = f"confirm_del_company_{cid}"
-                if st.session_state.get(confirm_key):
-                    st.warning(f"Are you sure you want to delete **{comp_row['company_name']}** and all its updates?")
-                    yes_col, no_col, _ = st.columns([1, 1, 4])
-                    if yes_col.button("Yes, delete", key=f"yes_del_{cid}", type="primary"):
-                        delete_company(cid)
-                        st.session_state.pop(confirm_key, None)
-                        st.rerun()
-                    if no_col.button("Cancel", key=f"no_del_{cid}"):
-                        st.session_state.pop(confirm_key, None)
-                        st.rerun()
-                else:
-                    if st.button("Delete company", key=f"del_{cid}"):
-                        st.session_state[confirm_key] = True
-                        st.rerun()
+                _company_delete_controls(comp_row.company_id, comp_row.company_name)
     else:
         st.markdown(
             '<div class="empty-state"><h3>No companies onboarded yet</h3>'
@@ -721,62 +1209,69 @@ with submit_tab:
     if companies_df.empty:
         st.info("Onboard at least one company in the **Onboard Companies** tab before submitting updates.")
     else:
-        company_lookup = {r["company_name"]: r for _, r in companies_df.iterrows()}
+        # Batch the inputs so typing in the text areas does not rerun the whole app.
+        # Values are kept on submit so a failed validation does not wipe a long report.
+        with st.form("submit_update", clear_on_submit=False):
+            st.markdown("### General Information")
+            g1, g2, g3 = st.columns(3)
+            with g1:
+                selected_company = st.selectbox("Company", _company_names(_data_version(COMPANIES_PATH)))
+            with g2:
+                reporting_period = st.text_input("Reporting Period", placeholder="e.g. January 2026")
+            with g3:
+                submitted_by = st.text_input("Submitted By", placeholder="e.g. Jane Smith")
 
-        st.markdown("### General Information")
-        g1, g2, g3 = st.columns(3)
-        with g1:
-            selected_company = st.selectbox("Company", sorted(company_lookup.keys()))
-        with g2:
-            reporting_period = st.text_input("Reporting Period", placeholder="e.g. January 2026")
-        with g3:
-            submitted_by = st.text_input("Submitted By", placeholder="e.g. Jane Smith")
+            st.markdown("---")
+            st.markdown("### Financial Metrics")
+            f1, f2, f3, f4 = st.columns(4)
+            revenue = f1.text_input("Revenue", placeholder="e.g. $150,000")
+            expenses = f2.text_input("Expenses", placeholder="e.g. $120,000")
+            cash = f3.text_input("Cash on Hand", placeholder="e.g. $500,000")
+            runway_months = f4.number_input("Runway (months)", min_value=0, max_value=60, value=6)
 
-        st.markdown("---")
-        st.markdown("### Financial Metrics")
-        f1, f2, f3, f4 = st.columns(4)
-        revenue = f1.text_input("Revenue", placeholder="e.g. $150,000")
-        expenses = f2.text_input("Expenses", placeholder="e.g. $120,000")
-        cash = f3.text_input("Cash on Hand", placeholder="e.g. $500,000")
-        runway_months = f4.number_input("Runway (months)", min_value=0, max_value=60, value=6)
+            st.markdown("---")
+            st.markdown("### Progress & Challenges")
+            p1, p2 = st.columns(2)
+            with p1:
+                wins = st.text_area("Wins & Highlights", placeholder="Key achievements this period...", height=120)
+                asks = st.text_area(
+                    "Asks from Investors",
+                    placeholder="Introductions, advice, or resources needed...",
+                    height=120,
+                )
+            with p2:
+                challenges = st.text_area(
+                    "Challenges & Risks", placeholder="Current obstacles or concerns...", height=120
+                )
+                investment_update = st.text_area(
+                    "Investment Update",
+                    placeholder="Fundraise status, cap table changes...",
+                    height=120,
+                )
 
-        st.markdown("---")
-        st.markdown("### Progress & Challenges")
-        p1, p2 = st.columns(2)
-        with p1:
-            wins = st.text_area("Wins & Highlights", placeholder="Key achievements this period...", height=120)
-            asks = st.text_area(
-                "Asks from Investors",
-                placeholder="Introductions, advice, or resources needed...",
-                height=120,
-            )
-        with p2:
-            challenges = st.text_area(
-                "Challenges & Risks", placeholder="Current obstacles or concerns...", height=120
-            )
-            investment_update = st.text_area(
-                "Investment Update",
-                placeholder="Fundraise status, cap table changes...",
-                height=120,
+            st.markdown("---")
+            st.markdown("### Narrative & Meetings")
+            narrative = st.text_area(
+                "Investor-Ready Narrative",
+                placeholder="A concise summary suitable for LP reporting...",
+                height=140,
             )
+            n1, n2 = st.columns(2)
+            with n1:
+                meeting_agenda = st.text_area(
+                    "Meeting Agenda", placeholder="Topics for the next board meeting...", height=120
+                )
+            with n2:
+                meeting_minutes = st.text_area(
+                    "Meeting Minutes", placeholder="Notes from the last meeting...", height=120
+                )
 
-        st.markdown("---")
-        st.markdown("### Narrative & Meetings")
-        narrative = st.text_area(
-            "Investor-Ready Narrative",
-            placeholder="A concise summary suitable for LP reporting...",
-            height=140,
-        )
-        n1, n2 = st.columns(2)
-        with n1:
-            meeting_agenda = st.text_area("Meeting Agenda", placeholder="Topics for the next board meeting...", height=120)
-        with n2:
-            meeting_minutes = st.text_area("Meeting Minutes", placeholder="Notes from the last meeting...", height=120)
-
-        data_warehouse_link = st.text_input("Data Warehouse Link", placeholder="https://...")
+            data_warehouse_link = st.text_input("Data Warehouse Link", placeholder="https://...")
 
-        st.markdown("")
-        submit_update = st.button("Save Update & Generate PDF", type="primary", use_container_width=True)
+            st.markdown("")
+            submit_update = st.form_submit_button(
+                "Save Update", type="primary", use_container_width=True
+            )
 
         if submit_update:
             if not reporting_period.strip() or not submitted_by.strip():
@@ -784,8 +1279,8 @@ with submit_tab:
             else:
                 payload = {
                     "update_id": uuid.uuid4().hex,
-                    "submission_date": str(date.today()),
-                    "company_id": company_lookup[selected_company]["company_id"],
+                    "submission_date": today.isoformat(),
+                    "company_id": _company_ids(_data_version(COMPANIES_PATH))[selected_company],
                     "company_name": selected_company,
                     "reporting_period": reporting_period.strip(),
                     "revenue": revenue.strip(),
@@ -803,26 +1298,13 @@ with submit_tab:
                     "submitted_by": submitted_by.strip(),
                     "pdf_path": "",
                 }
-                pdf_path = generate_pdf(payload)
-                payload["pdf_path"] = pdf_path
+                # The PDF is rendered later, from the dashboard, so saving never waits on fpdf.
                 add_update(payload)
 
                 # Update next due date
-                companies_mut = companies_df.copy()
-                idx = companies_mut.index[companies_mut["company_name"] == selected_company][0]
-                comp_cadence = companies_mut.loc[idx, "reporting_cadence"]
-                companies_mut.loc[idx, "next_due_date"] = str(next_due_from_today(comp_cadence))
-                save_companies(companies_mut)
-
-                st.success(f"Update for **{selected_company}** saved successfully. PDF generated.")
-                with open(pdf_path, "rb") as f:
-                    st.download_button(
-                        "Download PDF Report",
-                        data=f,
-                        file_name=os.path.basename(pdf_path),
-                        mime="application/pdf",
-                        use_container_width=True,
-                    )
+                set_company_due_date(payload["company_id"], today)
+
+                st.success(f"Update for **{selected_company}** saved successfully.")
                 st.rerun()
 
 # ---- TAB 3: Reminder Sequences ----
@@ -833,48 +1315,38 @@ with sequences_tab:
     if companies_df.empty:
         st.info("No companies onboarded yet. Head to the **Onboard Companies** tab to get started.")
     else:
-        today = date.today()
-        due_sorted = companies_df.sort_values("next_due_date")
-
-        # Summary cards
-        overdue_list = []
-        upcoming_list = []
-        on_track_list = []
-
-        for _, row in due_sorted.iterrows():
-            due_date = row["next_due_date"].date() if pd.notna(row["next_due_date"]) else None
-            status = _due_status(due_date, today)
-            if status == "overdue":
-                overdue_list.append(row)
-            elif status == "upcoming":
-                upcoming_list.append(row)
-            else:
-                on_track_list.append(row)
+        due_sorted = _companies_by_due_date(_data_version(COMPANIES_PATH))
+
+        # Summary cards (companies without a due date count as on track)
+        statuses = _due_statuses(due_sorted["next_due_date"], today)
+        overdue_total = int((statuses == "overdue").sum())
+        upcoming_total = int((statuses == "upcoming").sum())
+        on_track_total = len(statuses) - overdue_total - upcoming_total
 
         s1, s2, s3 = st.columns(3)
-        s1.markdown(f"**:red[Overdue]** — {len(overdue_list)} companies")
-        s2.markdown(f"**:orange[Due Soon]** — {len(upcoming_list)} companies")
-        s3.markdown(f"**:green[On Track]** — {len(on_track_list)} companies")
+        s1.markdown(f"**:red[Overdue]** — {overdue_total} companies")
+        s2.markdown(f"**:orange[Due Soon]** — {upcoming_total} companies")
+        s3.markdown(f"**:green[On Track]** — {on_track_total} companies")
 
         st.markdown("---")
 
-        # Show all companies with status
-        for _, row in due_sorted.iterrows():
-            due_date = row["next_due_date"].date() if pd.notna(row["next_due_date"]) else today
-            status = _due_status(due_date, today)
-            status_label = _status_html(status)
+        # Show all companies with status; undated companies are listed as due today.
+        row_statuses = np.where(statuses == "unknown", "upcoming", statuses)
+        due_strs = due_sorted["next_due_date"].dt.strftime("%Y-%m-%d").fillna(today.isoformat())
+        for row, status, due_date in zip(due_sorted.itertuples(index=False), row_statuses, due_strs):
+            status_label = _STATUS_BADGES[status]
 
-            with st.expander(f"{row['company_name']}  —  Due: {due_date}  ({status.replace('-', ' ').title()})"):
+            with st.expander(f"{row.company_name}  —  Due: {due_date}  ({status.replace('-', ' ').title()})"):
                 info_col, action_col = st.columns([2, 1])
                 with info_col:
-                    st.markdown(f"**Contact:** {row['contact_name']} ({row['contact_email']})")
-                    st.markdown(f"**Portfolio Manager:** {row['portfolio_manager']}")
-                    st.markdown(f"**Cadence:** {row['reporting_cadence']}  |  **Fund:** {row['fund']}")
+                    st.markdown(f"**Contact:** {row.contact_name} ({row.contact_email})")
+                    st.markdown(f"**Portfolio Manager:** {row.portfolio_manager}")
+                    st.markdown(f"**Cadence:** {row.reporting_cadence}  |  **Fund:** {row.fund}")
                 with action_col:
                     st.markdown(status_label, unsafe_allow_html=True)
 
                 st.markdown("**Draft Reminder Email:**")
-                msg = reminder_text(row["company_name"], row["reporting_cadence"], str(due_date))
+                msg = reminder_text(row.company_name, row.reporting_cadence, due_date)
                 st.code(msg, language=None)
 
 # ---- TAB 4: Dashboard & PDF Exports ----
@@ -884,156 +1356,44 @@ with dashboard_tab:
     if updates_df.empty:
         st.info("No updates have been submitted yet. Use the **Submit Update** tab to add your first report.")
     else:
-        # Search and filter controls
-        filter_col1, filter_col2 = st.columns([3, 1])
-        with filter_col1:
-            search = st.text_input(
-                "Search updates",
-                placeholder="Search by company, narrative, wins, or challenges...",
-                label_visibility="collapsed",
-            )
-        with filter_col2:
-            if not companies_df.empty:
-                company_filter = st.selectbox(
-                    "Filter by company",
-                    ["All Companies"] + sorted(companies_df["company_name"].unique().tolist()),
-                    label_visibility="collapsed",
-                )
-            else:
-                company_filter = "All Companies"
-
-        filtered = updates_df.copy()
-
-        # Apply company filter
-        if company_filter != "All Companies":
-            filtered = filtered[filtered["company_name"] == company_filter]
-
-        # Apply text search
-        if search.strip():
-            query = search.lower().strip()
-            mask = (
-                filtered["company_name"].fillna("").str.lower().str.contains(query, regex=False)
-                | filtered["narrative"].fillna("").str.lower().str.contains(query, regex=False)
-                | filtered["wins"].fillna("").str.lower().str.contains(query, regex=False)
-                | filtered["challenges"].fillna("").str.lower().str.contains(query, regex=False)
-            )
-            filtered = filtered[mask]
-
-        filtered = filtered.sort_values("submission_date", ascending=False)
-
-        st.markdown(f"Showing **{len(filtered)}** of **{len(updates_df)}** updates")
-        st.markdown("")
-
-        # Display table
-        display_updates = filtered.copy()
-        display_updates["submission_date"] = display_updates["submission_date"].dt.strftime("%Y-%m-%d")
-
-        st.dataframe(
-            display_updates[
-                [
-                    "submission_date",
-                    "company_name",
-                    "reporting_period",
-                    "revenue",
-                    "expenses",
-                    "cash",
-                    "runway_months",
-                    "submitted_by",
-                ]
-            ].rename(
-                columns={
-                    "submission_date": "Date",
-                    "company_name": "Company",
-                    "reporting_period": "Period",
-                    "revenue": "Revenue",
-                    "expenses": "Expenses",
-                    "cash": "Cash",
-                    "runway_months": "Runway (mo)",
-                    "submitted_by": "Submitted By",
-                }
-            ),
-            use_container_width=True,
-            hide_index=True,
-        )
-
-        # Detail view for each update
-        if not filtered.empty:
-            st.markdown("---")
-            st.markdown("### Update Details")
-
-            for _, row in filtered.iterrows():
-                uid = row["update_id"]
-                sub_date = row["submission_date"].strftime("%Y-%m-%d") if pd.notna(row["submission_date"]) else "N/A"
-                with st.expander(f"{row['company_name']} — {row['reporting_period']} ({sub_date})"):
-                    d1, d2 = st.columns(2)
-                    with d1:
-                        st.markdown(f"**Revenue:** {row['revenue'] or 'N/A'}")
-                        st.markdown(f"**Expenses:** {row['expenses'] or 'N/A'}")
-                        st.markdown(f"**Cash:** {row['cash'] or 'N/A'}")
-                        st.markdown(f"**Runway:** {row['runway_months']} months")
-                    with d2:
-                        st.markdown(f"**Submitted By:** {row['submitted_by']}")
-                        st.markdown(f"**Date:** {sub_date}")
-                        if row.get("data_warehouse_link"):
-                            st.markdown(f"**Data Link:** {row['data_warehouse_link']}")
-
-                    if row.get("wins"):
-                        st.markdown(f"**Wins:** {row['wins']}")
-                    if row.get("challenges"):
-                        st.markdown(f"**Challenges:** {row['challenges']}")
-                    if row.get("asks"):
-                        st.markdown(f"**Asks:** {row['asks']}")
-                    if row.get("narrative"):
-                        st.markdown(f"**Narrative:** {row['narrative']}")
-
-                    # Actions row: PDF download + delete
-                    act1, act2, _ = st.columns([1, 1, 2])
-                    with act1:
-                        if row.get("pdf_path") and os.path.exists(row["pdf_path"]):
-                            with open(row["pdf_path"], "rb") as f:
-                                st.download_button(
-                                    "Download PDF",
-                                    data=f,
-                                    file_name=os.path.basename(row["pdf_path"]),
-                                    mime="application/pdf",
-                                    key=f"pdf_{uid}",
-                                    use_container_width=True,
-                                )
-                    with act2:
-                        confirm_key = f"confirm_del_update_{uid}"
-                        if st.session_state.get(confirm_key):
-                            st.warning("Delete this update?")
-                            y_col, n_col = st.columns(2)
-                            if y_col.button("Yes", key=f"yes_del_u_{uid}", type="primary"):
-                                delete_update(uid)
-                                st.session_state.pop(confirm_key, None)
-                                st.rerun()
-                            if n_col.button("No", key=f"no_del_u_{uid}"):
-                                st.session_state.pop(confirm_key, None)
-                                st.rerun()
-                        else:
-                            if st.button("Delete update", key=f"del_u_{uid}", use_container_width=True):
-                                st.session_state[confirm_key] = True
-                                st.rerun()
+        _update_history(companies_df)
 
         # Export section
         st.markdown("---")
         st.markdown("### Export Data")
-        e1, e2 = st.columns(2)
+        e1, e2, e3 = st.columns(3)
         with e1:
             st.download_button(
                 "Download All Updates (JSON)",
-                data=json.dumps(_read_json_list(UPDATES_PATH), indent=2).encode("utf-8"),
+                data=_updates_json_bytes(_data_version(UPDATES_PATH)),
                 file_name="portfolio_updates.json",
                 mime="application/json",
                 use_container_width=True,
             )
         with e2:
-            csv_data = updates_df.to_csv(index=False).encode("utf-8")
             st.download_button(
                 "Download All Updates (CSV)",
-                data=csv_data,
+                data=_updates_csv_bytes(_data_version(UPDATES_PATH)),
                 file_name="portfolio_updates.csv",
                 mime="text/csv",
                 use_container_width=True,
             )
+        with e3:
+            # Zipping every report is only done once the user asks for the archive.
+            if st.session_state.get("pdf_archive_ready") or st.button(
+                "Prepare All PDFs (ZIP)", use_container_width=True
+            ):
+                st.session_state["pdf_archive_ready"] = True
+                archive, missing = _pdf_archive(_data_version(UPDATES_PATH))
+                st.download_button(
+                    "Download All PDFs (ZIP)",
+                    data=archive,
+                    file_name="portfolio_update_pdfs.zip",
+                    mime="application/zip",
+                    use_container_width=True,
+                )
+                if missing:
+                    st.caption(
+                        f"{missing} of {len(updates_df)} updates have no generated PDF yet and are not "
+                        "in the archive. Use **Generate PDF** under Update Details to add them."
+                    )